@@ -8,6 +8,7 @@ from selfdrive.car.hyundai.hyundaican import create_lkas11, create_clu11, create
                                              create_scc42a, create_scc7d0, create_fca11, create_fca12, create_mdps12
 from selfdrive.car.hyundai.values import Buttons, CarControllerParams, CAR, FEATURES
 from opendbc.can.packer import CANPacker
+from common.op_params import opParams
 from selfdrive.config import Conversions as CV
 from selfdrive.controls.lib.longcontrol import LongCtrlState
 
@@ -19,6 +20,8 @@ ACCEL_MAX = 2.  # 2.0 m/s2
 ACCEL_MIN = -3.5  # 3.5   m/s2
 ACCEL_SCALE = 1.
 
+GENESIS_MIN_STEER_SPEED = 55 * CV.KPH_TO_MS
+
 def accel_hysteresis(accel, accel_steady):
 
   # for small accel oscillations within ACCEL_HYST_GAP, don't change the accel command
@@ -86,6 +89,8 @@ class CarController():
     self.gapcount = 0
     self.current_veh_speed = 0
     self.lfainFingerprint = CP.lfaAvailable
+    self.lfa_available = True if self.lfainFingerprint or self.car_fingerprint in FEATURES["send_lfa_mfa"] else False
+    self.high_steer_allowed = True if self.car_fingerprint in FEATURES["allow_high_steer"] else False
     self.vdiff = 0
     self.resumebuttoncnt = 0
     self.lastresumeframe = 0
@@ -98,6 +103,7 @@ class CarController():
     self.sendaccmode = not CP.radarDisablePossible
     self.enabled = False
     self.sm = messaging.SubMaster(['controlsState'])
+    self.lkas_button_enabled = opParams().get('enableLKASbutton')
 
   def update(self, enabled, CS, frame, actuators, pcm_cancel_cmd, visual_alert,
              left_lane, right_lane, left_lane_depart, right_lane_depart,
@@ -120,11 +126,10 @@ class CarController():
     self.steer_rate_limited = new_steer != apply_steer
 
     # disable if steer angle reach 90 deg, otherwise mdps fault in some models
-    self.high_steer_allowed = True if self.car_fingerprint in FEATURES["allow_high_steer"] else False
     lkas_active = enabled and ((abs(CS.out.steeringAngleDeg) < CS.CP.maxSteeringAngleDeg) or self.high_steer_allowed)
 
     # fix for Genesis hard fault at low speed
-    if CS.out.vEgo < 55 * CV.KPH_TO_MS and self.car_fingerprint == CAR.HYUNDAI_GENESIS and CS.CP.minSteerSpeed > 0.:
+    if CS.out.vEgo < GENESIS_MIN_STEER_SPEED and self.car_fingerprint == CAR.HYUNDAI_GENESIS and CS.CP.minSteerSpeed > 0.:
       lkas_active = False
 
     if not lkas_active:
@@ -171,8 +176,6 @@ class CarController():
 
     can_sends = []
 
-    self.lfa_available = True if self.lfainFingerprint or self.car_fingerprint in FEATURES["send_lfa_mfa"] else False
-
     can_sends.append(create_lkas11(self.packer, frame, self.car_fingerprint, apply_steer, lkas_active,
                                    CS.lkas11, sys_warning, sys_state, enabled,
                                    left_lane, right_lane,
@@ -317,6 +320,6 @@ class CarController():
     if frame % 5 == 0 and self.lfa_available:
       can_sends.append(create_lfahda_mfc(self.packer, enabled))
 
-    can_sends.append(create_mdps12(self.packer, frame, CS.mdps12))
+    can_sends.append(create_mdps12(self.packer, frame, CS.mdps12, self.lkas_button_enabled))
 
     return can_sends
@@ -1,4 +1,3 @@
-import copy
 from cereal import car
 from selfdrive.car.hyundai.values import DBC, STEER_THRESHOLD, FEATURES, ELEC_VEH, HYBRID_VEH
 from selfdrive.car.interfaces import CarStateBase
@@ -215,18 +214,18 @@ class CarState(CarStateBase):
     self.brake_error = cp.vl["TCS13"]['ACCEnable'] != 0 # 0 ACC CONTROL ENABLED, 1-3 ACC CONTROL DISABLED
 
     # save the entire LKAS11, CLU11, SCC12 and MDPS12
-    self.lkas11 = copy.copy(cp_cam.vl["LKAS11"])
-    self.clu11 = copy.copy(cp.vl["CLU11"])
-    self.scc11 = copy.copy(cp_scc.vl["SCC11"])
-    self.scc12 = copy.copy(cp_scc.vl["SCC12"])
-    self.scc13 = copy.copy(cp_scc.vl["SCC13"])
-    self.scc14 = copy.copy(cp_scc.vl["SCC14"])
-    self.fca11 = copy.copy(cp_fca.vl["FCA11"])
-    self.mdps12 = copy.copy(cp_mdps.vl["MDPS12"])
-
-    self.scc11init = copy.copy(cp.vl["SCC11"])
-    self.scc12init = copy.copy(cp.vl["SCC12"])
-    self.fca11init = copy.copy(cp.vl["FCA11"])
+    self.lkas11 = dict(cp_cam.vl["LKAS11"])
+    self.clu11 = dict(cp.vl["CLU11"])
+    self.scc11 = dict(cp_scc.vl["SCC11"])
+    self.scc12 = dict(cp_scc.vl["SCC12"])
+    self.scc13 = dict(cp_scc.vl["SCC13"])
+    self.scc14 = dict(cp_scc.vl["SCC14"])
+    self.fca11 = dict(cp_fca.vl["FCA11"])
+    self.mdps12 = dict(cp_mdps.vl["MDPS12"])
+
+    self.scc11init = dict(cp.vl["SCC11"])
+    self.scc12init = dict(cp.vl["SCC12"])
+    self.fca11init = dict(cp.vl["FCA11"])
 
     return ret
 
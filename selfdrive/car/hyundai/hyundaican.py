@@ -1,6 +1,5 @@
 import crcmod
 
-from common.op_params import opParams
 from selfdrive.car.hyundai.values import CAR, CHECKSUM
 
 hyundai_checksum = crcmod.mkCrcFun(0x11D, initCrc=0xFD, rev=False, xorOut=0xdf)
@@ -201,9 +200,9 @@ def create_fca12(packer):
   }
   return packer.make_can_msg("FCA12", 0, values)
 
-def create_mdps12(packer, frame, mdps12):
+def create_mdps12(packer, frame, mdps12, lkas_button_enabled):
   values = mdps12
-  if opParams().get('enableLKASbutton'):
+  if lkas_button_enabled:
     values["CF_Mdps_ToiActive"] = 0
     values["CF_Mdps_ToiUnavail"] = 1
     values["CF_Mdps_MsgCount2"] = frame % 0x100
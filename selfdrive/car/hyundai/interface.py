@@ -18,6 +18,7 @@ class CarInterface(CarInterfaceBase):
     self.visiononlyWarning = False
     self.belowspeeddingtimer = 0.
     self.enabled_prev = False
+    self.lkas_button_enabled = opParams().get('enableLKASbutton')
 
   @staticmethod
   def compute_gb(accel, speed):
@@ -67,7 +68,10 @@ class CarInterface(CarInterfaceBase):
     ret.lateralTuning.pid.kfBP = [0., 10., 30.]
     ret.lateralTuning.pid.kfV = [0.000015, 0.00002, 0.000025]
 
-    if opParams().get('Enable_INDI'):
+    params = Params()
+    op_params = opParams()
+
+    if op_params.get('Enable_INDI'):
       ret.lateralTuning.init('indi')
       ret.lateralTuning.indi.innerLoopGainBP = [0.]
       ret.lateralTuning.indi.innerLoopGainV = [2.]
@@ -202,7 +206,7 @@ class CarInterface(CarInterfaceBase):
 
     # these cars require a special panda safety mode due to missing counters and checksums in the messages
 
-    ret.mdpsHarness = Params().get('MdpsHarnessEnabled') == b'1'
+    ret.mdpsHarness = params.get('MdpsHarnessEnabled') == b'1'
     ret.sasBus = 0 if (688 in fingerprint[0] or not ret.mdpsHarness) else 1
     ret.fcaBus = 0 if 909 in fingerprint[0] else 2 if 909 in fingerprint[2] else -1
     ret.bsmAvailable = True if 1419 in fingerprint[0] else False
@@ -211,14 +215,14 @@ class CarInterface(CarInterfaceBase):
     ret.evgearAvailable = True if 882 in fingerprint[0] else False
     ret.emsAvailable = True if 608 and 809 in fingerprint[0] else False
 
-    if Params().get('SccEnabled') == b'1':
-      ret.sccBus = 2 if 1057 in fingerprint[2] and Params().get('SccHarnessPresent') == b'1' else 0 if 1057 in fingerprint[0] else -1
+    if params.get('SccEnabled') == b'1':
+      ret.sccBus = 2 if 1057 in fingerprint[2] and params.get('SccHarnessPresent') == b'1' else 0 if 1057 in fingerprint[0] else -1
     else:
       ret.sccBus = -1
 
     ret.radarOffCan = (ret.sccBus == -1)
 
-    ret.openpilotLongitudinalControl = Params().get('LongControlEnabled') == b'1' and not (ret.sccBus == 0)
+    ret.openpilotLongitudinalControl = params.get('LongControlEnabled') == b'1' and not (ret.sccBus == 0)
 
     if ret.openpilotLongitudinalControl:
       ret.radarTimeStep = .05
@@ -233,10 +237,10 @@ class CarInterface(CarInterfaceBase):
                           CAR.KIA_CADENZA_HEV, CAR.GRANDEUR_HEV, CAR.KIA_NIRO_HEV, CAR.KONA_HEV]):
       ret.safetyModel = car.CarParams.SafetyModel.hyundaiCommunity
 
-    if ret.radarOffCan or (ret.sccBus == 2) or Params().get('EnableOPwithCC') == b'0':
+    if ret.radarOffCan or (ret.sccBus == 2) or params.get('EnableOPwithCC') == b'0':
       ret.safetyModel = car.CarParams.SafetyModel.hyundaiCommunityNonscc
 
-    if ret.mdpsHarness or opParams().get('smartMDPS'):
+    if ret.mdpsHarness or op_params.get('smartMDPS'):
       ret.minSteerSpeed = 0.
 
     ret.centerToFront = ret.wheelbase * 0.4
@@ -252,9 +256,9 @@ class CarInterface(CarInterfaceBase):
 
     ret.enableCamera = True
 
-    ret.radarDisablePossible = Params().get('RadarDisableEnabled') == b'1'
+    ret.radarDisablePossible = params.get('RadarDisableEnabled') == b'1'
 
-    ret.enableCruise = Params().get('EnableOPwithCC') == b'1' and ret.sccBus == 0
+    ret.enableCruise = params.get('EnableOPwithCC') == b'1' and ret.sccBus == 0
 
     if ret.radarDisablePossible:
       ret.openpilotLongitudinalControl = True
@@ -349,7 +353,7 @@ class CarInterface(CarInterfaceBase):
                 and ((self.CC.setspeed > self.CC.clu11_speed - 2) or ret.standstill or self.CC.usestockscc):
           events.add(EventName.buttonEnable)
           events.add(EventName.pcmEnable)
-        if b.type == ButtonType.cancel and b.pressed or self.CS.lkasbutton and opParams().get('enableLKASbutton'):
+        if b.type == ButtonType.cancel and b.pressed or self.CS.lkasbutton and self.lkas_button_enabled:
           events.add(EventName.buttonCancel)
           events.add(EventName.pcmDisable)
         if b.type == ButtonType.altButton3 and b.pressed:
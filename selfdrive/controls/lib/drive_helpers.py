@@ -8,6 +8,9 @@ ButtonCnt = 0
 LongPressed = False
 PrevGaspressed = False
 
+# set speed step direction for each cruise button
+CRUISE_BUTTON_DELTA = {ButtonType.accelCruise: 1, ButtonType.decelCruise: -1}
+
 # kph
 FIRST_PRESS_TIME = 1
 LONG_PRESS_TIME = 50
@@ -17,6 +20,8 @@ V_CRUISE_MIN = 0.6 * CV.MPH_TO_KPH
 V_CRUISE_LONG_PRESS_DELTA_MPH = 5
 V_CRUISE_LONG_PRESS_DELTA_KPH = 10
 V_CRUISE_ENABLE_MIN = 5 * CV.MPH_TO_KPH
+V_CRUISE_MIN_MPH = V_CRUISE_MIN * CV.KPH_TO_MPH
+V_CRUISE_MAX_MPH = V_CRUISE_MAX * CV.KPH_TO_MPH
 MPC_N = 16
 CAR_ROTATION_RADIUS = 0.0
 
@@ -52,43 +57,41 @@ def update_v_cruise(v_cruise_kph, v_ego, gas_pressed, buttonEvents, enabled, met
     if ButtonCnt:
       ButtonCnt += 1
     for b in buttonEvents:
-      if b.pressed and not ButtonCnt and (b.type == ButtonType.accelCruise or
-                                          b.type == ButtonType.decelCruise):
+      if b.pressed and not ButtonCnt and b.type in CRUISE_BUTTON_DELTA:
         ButtonCnt = FIRST_PRESS_TIME
         ButtonPrev = b.type
       elif not b.pressed:
         LongPressed = False
         ButtonCnt = 0
 
-    CurrentVspeed = clip(v_ego * CV.MS_TO_KPH, V_CRUISE_ENABLE_MIN, V_CRUISE_MAX)
-    CurrentVspeed = CurrentVspeed if metric else (CurrentVspeed * CV.KPH_TO_MPH)
-    CurrentVspeed = int(round(CurrentVspeed))
-
     v_cruise = v_cruise_kph if metric else int(round(v_cruise_kph * CV.KPH_TO_MPH))
+    delta = CRUISE_BUTTON_DELTA.get(ButtonPrev)
 
     if ButtonCnt > LONG_PRESS_TIME:
       LongPressed = True
-      V_CRUISE_DELTA = V_CRUISE_LONG_PRESS_DELTA_KPH if metric else V_CRUISE_LONG_PRESS_DELTA_MPH
-      if ButtonPrev == ButtonType.accelCruise:
-        v_cruise += V_CRUISE_DELTA - v_cruise % V_CRUISE_DELTA
-      elif ButtonPrev == ButtonType.decelCruise:
-        v_cruise -= V_CRUISE_DELTA - -v_cruise % V_CRUISE_DELTA
+      if delta is not None:
+        # step up/down to the next multiple of the long press delta
+        V_CRUISE_DELTA = V_CRUISE_LONG_PRESS_DELTA_KPH if metric else V_CRUISE_LONG_PRESS_DELTA_MPH
+        v_cruise += delta * (V_CRUISE_DELTA - (delta * v_cruise) % V_CRUISE_DELTA)
       ButtonCnt = FIRST_PRESS_TIME
     elif ButtonCnt == FIRST_PRESS_TIME and not LongPressed and not PrevDisable:
-      if ButtonPrev == ButtonType.accelCruise:
-        v_cruise = CurrentVspeed if (gas_pressed and not PrevGaspressed and (v_cruise < CurrentVspeed)) else (v_cruise + 1)
-        PrevGaspressed = gas_pressed
-      elif ButtonPrev == ButtonType.decelCruise:
-        v_cruise = CurrentVspeed if (gas_pressed and not PrevGaspressed) else (v_cruise - 1)
+      if delta is not None:
+        CurrentVspeed = clip(v_ego * CV.MS_TO_KPH, V_CRUISE_ENABLE_MIN, V_CRUISE_MAX)
+        CurrentVspeed = CurrentVspeed if metric else (CurrentVspeed * CV.KPH_TO_MPH)
+        CurrentVspeed = int(round(CurrentVspeed))
+
+        jump_to_current = gas_pressed and not PrevGaspressed
+        if delta > 0:
+          jump_to_current = jump_to_current and v_cruise < CurrentVspeed
+        v_cruise = CurrentVspeed if jump_to_current else (v_cruise + delta)
         PrevGaspressed = gas_pressed
     elif not gas_pressed:
       PrevGaspressed = False
 
-    v_cruise_min = V_CRUISE_MIN if metric else V_CRUISE_MIN * CV.KPH_TO_MPH
-    v_cruise_max = V_CRUISE_MAX if metric else V_CRUISE_MAX * CV.KPH_TO_MPH
-
-    v_cruise = clip(v_cruise, v_cruise_min, v_cruise_max)
-    v_cruise_kph = v_cruise if metric else v_cruise * CV.MPH_TO_KPH
+    if metric:
+      v_cruise_kph = clip(v_cruise, V_CRUISE_MIN, V_CRUISE_MAX)
+    else:
+      v_cruise_kph = clip(v_cruise, V_CRUISE_MIN_MPH, V_CRUISE_MAX_MPH) * CV.MPH_TO_KPH
 
     v_cruise_kph = int(round(v_cruise_kph))
 
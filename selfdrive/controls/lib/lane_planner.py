@@ -16,6 +16,13 @@ else:
   CAMERA_OFFSET = 0.0
   PATH_OFFSET = 0.0
 
+# lookup tables for laneline probability modifiers and lane width vs speed
+_LANE_WIDTH_PROB_BP = [4.0, 5.0]
+_LANE_WIDTH_PROB_V = [1.0, 0.0]
+_LANE_STD_PROB_BP = [.15, .3]
+_LANE_STD_PROB_V = [1.0, 0.0]
+_SPEED_LANE_WIDTH_BP = [0., 31.]
+_SPEED_LANE_WIDTH_V = [2.8, 3.5]
 
 
 class LanePlanner:
@@ -40,13 +47,15 @@ class LanePlanner:
 
 
   def parse_model(self, md):
-    if len(md.laneLines) == 4 and len(md.laneLines[0].t) == TRAJECTORY_SIZE:
-      self.ll_t = (np.array(md.laneLines[1].t) + np.array(md.laneLines[2].t))/2
+    lane_lines = md.laneLines
+    if len(lane_lines) == 4 and len(lane_lines[0].t) == TRAJECTORY_SIZE:
+      left_line, right_line = lane_lines[1], lane_lines[2]
+      self.ll_t = (np.array(left_line.t) + np.array(right_line.t))/2
       # left and right ll x is the same
-      self.ll_x = md.laneLines[1].x
+      self.ll_x = list(left_line.x)
       # only offset left and right lane lines; offsetting path does not make sense
-      self.lll_y = np.array(md.laneLines[1].y) - CAMERA_OFFSET
-      self.rll_y = np.array(md.laneLines[2].y) - CAMERA_OFFSET
+      self.lll_y = np.array(left_line.y) - CAMERA_OFFSET
+      self.rll_y = np.array(right_line.y) - CAMERA_OFFSET
       self.lll_prob = md.laneLineProbs[1]
       self.rll_prob = md.laneLineProbs[2]
       self.lll_std = md.laneLineStds[1]
@@ -65,14 +74,14 @@ class LanePlanner:
     prob_mods = []
     for t_check in [0.0, 1.5, 3.0]:
       width_at_t = interp(t_check * (v_ego + 7), self.ll_x, width_pts)
-      prob_mods.append(interp(width_at_t, [4.0, 5.0], [1.0, 0.0]))
+      prob_mods.append(interp(width_at_t, _LANE_WIDTH_PROB_BP, _LANE_WIDTH_PROB_V))
     mod = min(prob_mods)
     l_prob *= mod
     r_prob *= mod
 
     # Reduce reliance on uncertain lanelines
-    l_std_mod = interp(self.lll_std, [.15, .3], [1.0, 0.0])
-    r_std_mod = interp(self.rll_std, [.15, .3], [1.0, 0.0])
+    l_std_mod = interp(self.lll_std, _LANE_STD_PROB_BP, _LANE_STD_PROB_V)
+    r_std_mod = interp(self.rll_std, _LANE_STD_PROB_BP, _LANE_STD_PROB_V)
     l_prob *= l_std_mod
     r_prob *= r_std_mod
 
@@ -80,7 +89,7 @@ class LanePlanner:
     self.lane_width_certainty += 0.05 * (l_prob * r_prob - self.lane_width_certainty)
     current_lane_width = abs(self.rll_y[0] - self.lll_y[0])
     self.lane_width_estimate += 0.005 * (current_lane_width - self.lane_width_estimate)
-    speed_lane_width = interp(v_ego, [0., 31.], [2.8, 3.5])
+    speed_lane_width = interp(v_ego, _SPEED_LANE_WIDTH_BP, _SPEED_LANE_WIDTH_V)
     self.lane_width = self.lane_width_certainty * self.lane_width_estimate + \
                       (1 - self.lane_width_certainty) * speed_lane_width
 
@@ -92,11 +92,12 @@ class LateralPlanner():
     measured_curvature = sm['controlsState'].curvature
 
     md = sm['modelV2']
-    self.LP.parse_model(sm['modelV2'])
-    if len(md.position.x) == TRAJECTORY_SIZE and len(md.orientation.x) == TRAJECTORY_SIZE:
-      self.path_xyz = np.column_stack([md.position.x, md.position.y, md.position.z])
-      self.t_idxs = np.array(md.position.t)
-      self.plan_yaw = list(md.orientation.z)
+    self.LP.parse_model(md)
+    pos, orientation = md.position, md.orientation
+    if len(pos.x) == TRAJECTORY_SIZE and len(orientation.x) == TRAJECTORY_SIZE:
+      self.path_xyz = np.column_stack([pos.x, pos.y, pos.z])
+      self.t_idxs = np.array(pos.t)
+      self.plan_yaw = list(orientation.z)
 
     # Lane change logic
     one_blinker = sm['carState'].leftBlinker != sm['carState'].rightBlinker
@@ -1,3 +1,5 @@
+from collections import deque
+
 import numpy as np
 from common.numpy_fast import clip, interp
 from common.op_params import opParams
@@ -33,6 +35,7 @@ class PIController:
     self.i_rate = 1.0 / rate
     self.sat_limit = sat_limit
     self.convert = convert
+    self.nonlinearsas = opParams().get('nonlinearsas')
 
     self.reset()
 
@@ -72,12 +75,12 @@ class PIController:
     self.sat_count = 0.0
     self.saturated = False
     self.control = 0
-    self.errors = []
+    self.errors = deque(maxlen=5)
 
   def update(self, setpoint, measurement, speed=0.0, check_saturation=True, override=False, feedforward=0., deadzone=0., freeze_integrator=False):
     self.speed = speed
 
-    if opParams().get('nonlinearsas'):
+    if self.nonlinearsas:
       self.nl_p = interp(abs(setpoint), GainSaS_BP, Gain_g) * interp(self.speed, GainV_BP, Gain_V)
     else:
       self.nl_p = 0.
@@ -114,8 +117,6 @@ class PIController:
     self.saturated = self._check_saturation(control, check_saturation, error)
 
     self.errors.append(float(error))
-    while len(self.errors) > 5:
-      self.errors.pop(0)
 
     self.control = clip(control, self.neg_limit, self.pos_limit)
     return self.control